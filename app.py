@@ -25,6 +25,41 @@ os.environ.setdefault("KMP_BLOCKTIME", "0")           # Intel OpenMP: no post-re
 ROOT = os.path.dirname(os.path.abspath(__file__))
 app = Flask(__name__)
 
+# Every /step and /state response serializes the full aircraft list, so use
+# orjson for the JSON provider when it's installed (Flask >= 2.2); otherwise
+# Flask's stdlib-json provider is used unchanged. Key order isn't sorted by
+# default -- no client depends on it. NaN/inf serialise as null under orjson.
+try:
+    import orjson as _orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    _orjson = None
+else:
+    class OrjsonProvider(DefaultJSONProvider):
+        sort_keys = False
+
+        def dumps(self, obj, **kwargs):
+            # jsonify passes compact separators or indent=2; sort_keys maps to
+            # an orjson option. Anything else goes to the stdlib provider.
+            indent = kwargs.get('indent')
+            layout = (indent, kwargs.get('separators'))
+            if (kwargs.keys() - {'indent', 'sort_keys', 'separators'}
+                    or layout not in ((None, None), (None, (',', ':')), (2, None))):
+                return super().dumps(obj, **kwargs)
+            option = _orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= _orjson.OPT_INDENT_2
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= _orjson.OPT_SORT_KEYS
+            return _orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s, **kwargs):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return _orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
 # Disable Nagle's algorithm on the Werkzeug dev server. Without TCP_NODELAY, the
 # browser's tiny /step POSTs hit a Nagle + TCP delayed-ACK stall (~300ms on every
 # other request) that makes the radar tick limp one-fast-one-slow. Use this
@@ -89,9 +124,9 @@ class Session:
             st["on"] = self.auto_on
         return st
 
-    def state_payload(self):
+    def state_payload(self, include_static=True):
         """sim state + AUTO overlay (planning flag, flight-plan lines) when on."""
-        s = self.sim.get_state()
+        s = self.sim.get_state(include_static)
         if self.auto_on and self.is_simulated() and self.auto_planner is not None:
             s.update(self.auto_planner.overlay())
         return s
@@ -178,8 +213,9 @@ def step():
             sess.auto_planner.step(sess.sim)
     else:
         for _ in range(sess.sim.fast_forward):
-            sess.sim.step(1.0)
-    resp = jsonify(sess.state_payload())
+            sess.sim.step(1.0, return_state=False)
+    # The client keeps "static" from /state or /restart; it is not resent per tick.
+    resp = jsonify(sess.state_payload(include_static=False))
     resp.headers['Cache-Control'] = 'no-store'
     return resp
 
@@ -441,6 +477,22 @@ def _warm_parser():
         print(f"[parser] warmup skipped: {e}")
 
 
+def _warm_layouts():
+    """Parse and project every airport's data files once at boot, so the first
+    session (and the first restart onto another airport) doesn't pay it inside
+    a request. Builds a throwaway sim the way Session does, so the memoized
+    layout (per size/range/mtime) is exactly the one sessions will ask for."""
+    try:
+        data_dir = os.path.join(ROOT, 'environment', 'data')
+        names = sorted(f[:-len('_navigation.json')] for f in os.listdir(data_dir)
+                       if f.endswith('_navigation.json'))
+        for name in names:
+            SimulationEnv(radar_side=RADAR_SIDE, airport_name=name)
+        print(f"[layout] airport data warmed ({', '.join(names)})")
+    except Exception as e:
+        print(f"[layout] warmup skipped: {e}")
+
+
 def _truthy(v):
     return str(v).strip().lower() in ('1', 'true', 'yes', 'on')
 
@@ -468,6 +520,7 @@ if _mp.current_process().name == 'MainProcess':
         print(f"[warmup] numpy preimport skipped: {e}")
 
     def _warm_all():
+        _warm_layouts()   # cheap, and every first /state needs it
         _warm_tts()
         if _truthy(os.environ.get('ATC_WARM_STT', '1')):
             _warm_stt()
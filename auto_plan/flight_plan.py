@@ -15,8 +15,9 @@ which left it stale at None).
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from auto_plan import rollout as _ro
 from auto_plan.rollout import (
@@ -28,7 +29,7 @@ PLANNING_LATERAL_NM = 2.0
 WARN_VERTICAL_FT = 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class FlightPlan:
     callsign: str
     t0_sim: float
@@ -36,6 +37,8 @@ class FlightPlan:
     cursor: int = 0
     outcome: str = ''
     attempt: int = 0
+    _track: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _points: list | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def depleted(self) -> bool:
@@ -53,6 +56,31 @@ class FlightPlan:
     def advance(self) -> None:
         self.cursor += 1
 
+    def track(self) -> tuple:
+        """`(x, y, alt, on_ground)` arrays over the full state list, built once
+        per plan so conflict checks run as vector ops instead of dict walks."""
+        if self._track is None:
+            n = len(self.states)
+            self._track = (
+                np.fromiter((s['x'] for s in self.states), dtype=np.float64, count=n),
+                np.fromiter((s['y'] for s in self.states), dtype=np.float64, count=n),
+                np.fromiter((s['alt'] for s in self.states), dtype=np.float64, count=n),
+                np.fromiter((bool(s.get('on_ground')) for s in self.states),
+                            dtype=bool, count=n),
+            )
+        return self._track
+
+    def track_tail(self) -> tuple:
+        """`track()` aligned to the cursor (views, no copy)."""
+        return tuple(a[self.cursor:] for a in self.track())
+
+    def points_tail(self) -> list:
+        """Remaining `{'x', 'y'}` points for the UI overlay. The point dicts are
+        built once per plan; each tick only slices them at the cursor."""
+        if self._points is None:
+            self._points = [{'x': s['x'], 'y': s['y']} for s in self.states]
+        return self._points[self.cursor:]
+
 
 # --------------------------------------------------------------------------- #
 # Conflict detection over recorded per-tick state lists.
@@ -60,56 +88,79 @@ class FlightPlan:
 
 
 def find_conflicts(plans: dict, nm_per_pixel: float, max_ticks: int) -> list:
+    """Conflicting pairs among the plans' remaining tails over the first
+    `max_ticks + 1` ticks, ordered by first conflict tick (then plan order)."""
     cs_list = list(plans.keys())
-    pair_data: dict = {}
-    for t in range(max_ticks + 1):
-        for i in range(len(cs_list)):
-            for j in range(i + 1, len(cs_list)):
-                a, b = cs_list[i], cs_list[j]
-                ta, tb = plans[a], plans[b]
-                if t >= len(ta) or t >= len(tb):
-                    continue
-                sa, sb = ta[t], tb[t]
-                if bool(sa.get('on_ground')) != bool(sb.get('on_ground')):
-                    continue
-                if abs(sa['alt'] - sb['alt']) >= WARN_VERTICAL_FT:
-                    continue
-                dx = sa['x'] - sb['x']
-                dy = sa['y'] - sb['y']
-                lateral_nm = math.sqrt(dx * dx + dy * dy) * nm_per_pixel
-                if lateral_nm >= PLANNING_LATERAL_NM:
-                    continue
-                rec = pair_data.get((a, b))
-                if rec is None:
-                    pair_data[(a, b)] = {'a': a, 'b': b, 'first_t': t,
-                                         'min_sep_nm': lateral_nm, 'min_sep_t': t}
-                elif lateral_nm < rec['min_sep_nm']:
-                    rec['min_sep_nm'] = lateral_nm
-                    rec['min_sep_t'] = t
-    return list(pair_data.values())
+    tails = [plans[cs].track_tail() for cs in cs_list]
+    # Broad phase: a box over each tail's checked window covers every pair
+    # window, so pairs whose boxes are >= the cone apart cannot conflict.
+    boxes = [_tail_box(tail, max_ticks + 1) for tail in tails]
+    found = []
+    for i in range(len(cs_list)):
+        tail_a = tails[i]
+        box_a = boxes[i]
+        for j in range(i + 1, len(cs_list)):
+            tail_b = tails[j]
+            n = min(len(tail_a[0]), len(tail_b[0]), max_ticks + 1)
+            if n == 0:
+                continue
+            if _boxes_apart(box_a, boxes[j], nm_per_pixel):
+                continue
+            sep = _tail_separation_nm(tail_a, tail_b, nm_per_pixel, n)
+            hits = np.flatnonzero(sep < PLANNING_LATERAL_NM)
+            if hits.size == 0:
+                continue
+            min_t = int(np.argmin(sep))
+            found.append((int(hits[0]), i, j, {
+                'a': cs_list[i], 'b': cs_list[j], 'first_t': int(hits[0]),
+                'min_sep_nm': float(sep[min_t]), 'min_sep_t': min_t}))
+    found.sort(key=lambda rec: rec[:3])
+    return [rec[3] for rec in found]
+
+
+def _tail_box(tail, n):
+    """`(x_min, x_max, y_min, y_max)` over the first `n` ticks of a track
+    tail, or None when the tail is empty."""
+    x, y = tail[0][:n], tail[1][:n]
+    if x.size == 0:
+        return None
+    return (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+
+
+def _boxes_apart(box_a, box_b, nm_per_pixel):
+    """True when two tail boxes are at least the lateral cone apart on either
+    axis. Per-tick separation is never below the axis gap, so this only ever
+    rules out pairs `_tail_separation_nm` would also find clean."""
+    if box_a is None or box_b is None:
+        return False
+    gap = max(box_b[0] - box_a[1], box_a[0] - box_b[1],
+              box_b[2] - box_a[3], box_a[2] - box_b[3])
+    return gap * nm_per_pixel >= PLANNING_LATERAL_NM
 
 
-def _aligned_tail(plan: 'FlightPlan') -> list:
-    return plan.states[plan.cursor:]
+def _tail_separation_nm(tail_a, tail_b, nm_per_pixel, n):
+    """Per-tick lateral separation (NM) over the first `n` ticks of two track
+    tails; inf where the pair is outside the cone's medium/vertical gate."""
+    xa, ya, alt_a, gnd_a = (a[:n] for a in tail_a)
+    xb, yb, alt_b, gnd_b = (a[:n] for a in tail_b)
+    dx = xa - xb
+    dy = ya - yb
+    lat_nm = np.sqrt(dx * dx + dy * dy) * nm_per_pixel
+    gated = (gnd_a == gnd_b) & (np.abs(alt_a - alt_b) < WARN_VERTICAL_FT)
+    return np.where(gated, lat_nm, np.inf)
 
 
 def _pair_conflict(plan_a, plan_b, nm_per_pixel, max_ticks):
-    tail_a = _aligned_tail(plan_a)
-    tail_b = _aligned_tail(plan_b)
-    n = min(len(tail_a), len(tail_b), max_ticks + 1)
+    tail_a = plan_a.track_tail()
+    tail_b = plan_b.track_tail()
+    n = min(len(tail_a[0]), len(tail_b[0]), max_ticks + 1)
     min_sep = float('inf')
     min_sep_t = -1
-    for t in range(n):
-        sa, sb = tail_a[t], tail_b[t]
-        if bool(sa.get('on_ground')) != bool(sb.get('on_ground')):
-            continue
-        if abs(sa['alt'] - sb['alt']) >= WARN_VERTICAL_FT:
-            continue
-        dx = sa['x'] - sb['x']
-        dy = sa['y'] - sb['y']
-        lat_nm = math.sqrt(dx * dx + dy * dy) * nm_per_pixel
-        if lat_nm < min_sep:
-            min_sep = lat_nm
+    if n > 0:
+        sep = _tail_separation_nm(tail_a, tail_b, nm_per_pixel, n)
+        t = int(np.argmin(sep))
+        if sep[t] < min_sep:
+            min_sep = float(sep[t])
             min_sep_t = t
     return (min_sep < PLANNING_LATERAL_NM, min_sep, min_sep_t)
 
@@ -157,24 +208,19 @@ def _search_clean_assignment(candidates, loc_locked, nm_per_pixel,
     return None
 
 
-def _min_sep_against(my_states, my_cs, all_plans, nm_per_pixel):
+def _min_sep_against(my_plan, my_cs, all_plans, nm_per_pixel):
     ms = float('inf')
+    my_tail = my_plan.track_tail()
     for cs_other, p_other in all_plans.items():
         if cs_other == my_cs:
             continue
-        other_states = _aligned_tail(p_other)
-        n = min(len(my_states), len(other_states))
-        for t in range(n):
-            sa, sb = my_states[t], other_states[t]
-            if bool(sa.get('on_ground')) != bool(sb.get('on_ground')):
-                continue
-            if abs(sa['alt'] - sb['alt']) >= WARN_VERTICAL_FT:
-                continue
-            dx = sa['x'] - sb['x']
-            dy = sa['y'] - sb['y']
-            lat_nm = math.sqrt(dx * dx + dy * dy) * nm_per_pixel
-            if lat_nm < ms:
-                ms = lat_nm
+        other_tail = p_other.track_tail()
+        n = min(len(my_tail[0]), len(other_tail[0]))
+        if n == 0:
+            continue
+        sep = float(_tail_separation_nm(my_tail, other_tail, nm_per_pixel, n).min())
+        if sep < ms:
+            ms = sep
     return ms
 
 
@@ -190,8 +236,7 @@ def _maximize_separation(plans, all_attempts, loc_locked, nm_per_pixel, max_roun
             best_score = -1.0
             best_plan = None
             for candidate in all_attempts[cs]:
-                tail = _aligned_tail(candidate)
-                score = _min_sep_against(tail, cs, chosen, nm_per_pixel)
+                score = _min_sep_against(candidate, cs, chosen, nm_per_pixel)
                 if score > best_score:
                     best_score = score
                     best_plan = candidate
@@ -400,8 +445,7 @@ def replan_all(sim_live, runtime, active_planes, existing_plans=None,
                         for cs, idx in assignment.items()}, []
 
         plans = _maximize_separation(plans, candidates, loc_locked, nmpp)
-        tails = {cs: _aligned_tail(p) for cs, p in plans.items()}
-        conflicts = find_conflicts(tails, nmpp, plan_steps)
+        conflicts = find_conflicts(plans, nmpp, plan_steps)
         missing = armed_set - set(plans.keys())
         offenders = set()
         for c in conflicts:
@@ -415,5 +459,4 @@ def replan_all(sim_live, runtime, active_planes, existing_plans=None,
         pending = next_pending
 
     plans = _maximize_separation(plans, candidates, loc_locked, nmpp)
-    tails = {cs: _aligned_tail(p) for cs, p in plans.items()}
-    return plans, find_conflicts(tails, nmpp, plan_steps)
+    return plans, find_conflicts(plans, nmpp, plan_steps)
@@ -162,10 +162,9 @@ class AutoPlanner:
         fp = {}
         with self._lock:
             for cs, plan in self.flight_plans.items():
-                tail = plan.states[plan.cursor:]
-                if len(tail) < 2:
+                if plan.remaining < 2:
                     continue
-                fp[cs] = {'states': [{'x': s['x'], 'y': s['y']} for s in tail]}
+                fp[cs] = {'states': plan.points_tail()}
             conflicts = list(self._residual_conflicts)
         out['flight_plans'] = fp
         if conflicts:
@@ -180,7 +179,7 @@ class AutoPlanner:
         on; it runs the full fast_forward loop itself."""
         if not self.started or self.runtime is None:
             for _ in range(sim.fast_forward):
-                sim.step(1.0)
+                sim.step(1.0, return_state=False)
             return
 
         # Prune bookkeeping for planes the sim has removed. armed /
@@ -212,7 +211,7 @@ class AutoPlanner:
             self._apply_flight_plans(sim)
             armed_no_plan = self.armed - set(self.flight_plans.keys())
             self.runtime.tick(sim, armed=armed_no_plan)
-            sim.step(1.0)
+            sim.step(1.0, return_state=False)
         self._check_arm(sim)
 
     # ---------------- async replanning ---------------- #
@@ -359,7 +358,7 @@ class AutoPlanner:
                 ac.landed = True
             ac.trajectory.append((ac.x, ac.y))
             if len(ac.trajectory) > TRAJ_LENGTH:
-                ac.trajectory = ac.trajectory[-TRAJ_LENGTH:]
+                del ac.trajectory[:-TRAJ_LENGTH]
             if not hasattr(ac, '_plan_orig_update'):
                 ac._plan_orig_update = ac.update
                 ac.update = types.MethodType(lambda self, dt: None, ac)
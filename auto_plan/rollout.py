@@ -164,9 +164,9 @@ ROLLOUT_GROUND_DECEL_BONUS_KT = 3.0
 
 
 def _is_landed(sub_sim, ac_obj, num_landed_before):
-    if ac_obj is not None and getattr(ac_obj, 'landed', False):
+    if ac_obj is not None and ac_obj.landed:
         return True
-    if getattr(sub_sim, 'num_landed', 0) > num_landed_before:
+    if sub_sim.num_landed > num_landed_before:
         return True
     return False
 
@@ -183,7 +183,7 @@ def _record(t, ac):
         'loc': bool(ac.loc_intercepted), 'gs': bool(ac.gs_intercepted),
         'on_ground': str(ac.on_ground) if ac.on_ground else '',
         'ils_runway': ac.ils_runway or '',
-        'landed': bool(getattr(ac, 'landed', False)),
+        'landed': bool(ac.landed),
     }
 
 
@@ -205,7 +205,7 @@ def _run_rollout(sub_sim, ac_obj, rollout_cs, runtime, max_steps):
 
     armed_local = {rollout_cs}
     points = [_record(0, ac_obj)]
-    n_landed_before = getattr(sub_sim, 'num_landed', 0)
+    n_landed_before = sub_sim.num_landed
 
     for step_i in range(1, max_steps + 1):
         runtime.tick(sub_sim, armed=armed_local)
@@ -215,7 +215,7 @@ def _run_rollout(sub_sim, ac_obj, rollout_cs, runtime, max_steps):
                 ac_pre.target_airspeed = FINAL_APPROACH_KT
             if ac_pre.on_ground and ac_pre.airspeed > 0:
                 ac_pre.airspeed = max(0.0, ac_pre.airspeed - ROLLOUT_GROUND_DECEL_BONUS_KT)
-        sub_sim.step(1.0)
+        sub_sim.step(1.0, return_state=False)
         ac_now = sub_sim.aircraft_list.get(rollout_cs)
 
         if ac_now is not None:
@@ -34,7 +34,7 @@ N_FEATURES = 10
 _CFG_DIR = Path(__file__).resolve().parent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunwayGeometry:
     thr_x_nm: float
     thr_y_nm: float
@@ -85,7 +85,24 @@ def _stable_seed(callsign: str) -> int:
     return zlib.crc32(callsign.encode('utf-8')) & 0x7FFFFFFF
 
 
-@dataclass
+def _policy_view(ac) -> dict:
+    """The subset of sim.get_state()'s per-aircraft dict the policy reads."""
+    return {
+        'callsign': ac.callsign,
+        'x': ac.x,
+        'y': ac.y,
+        'heading': ac.heading,
+        'altitude': ac.altitude,
+        'airspeed': ac.airspeed,
+        'target_heading': ac.target_heading,
+        'target_airspeed': ac.target_airspeed,
+        'loc': ac.loc_intercepted,
+        'gs': ac.gs_intercepted,
+        'landed': ac.landed,
+    }
+
+
+@dataclass(slots=True)
 class _CallsignState:
     cleared: bool = False
     fm_seed: int | None = None
@@ -155,35 +172,48 @@ class Runtime:
 
     def encode_state(self, ac: dict, nm_per_pixel: float,
                      airport_x: float, airport_y: float) -> np.ndarray:
-        x_nm = (ac['x'] - airport_x) * nm_per_pixel
-        y_nm = -(ac['y'] - airport_y) * nm_per_pixel
+        return self.encode_batch([ac], nm_per_pixel, airport_x, airport_y)[0]
 
+    def encode_batch(self, acs: list[dict], nm_per_pixel: float,
+                     airport_x: float, airport_y: float) -> np.ndarray:
+        """Encode several aircraft into one (N, N_FEATURES) float32 array.
+        Raw features are filled row by row in Python (rollouts encode one
+        aircraft per tick, where column-wise NumPy is slower); only the
+        standardization runs as one array op. Row i equals
+        encode_state(acs[i])."""
         phi = math.radians((self.geom.course_deg + 180.0) % 360.0)
         sin_phi, cos_phi = math.sin(phi), math.cos(phi)
-        dx = x_nm - self.geom.thr_x_nm
-        dy = y_nm - self.geom.thr_y_nm
-        a_nm = dx * sin_phi + dy * cos_phi
-        c_nm = -dx * cos_phi + dy * sin_phi
-        d_thr = math.sqrt(a_nm * a_nm + c_nm * c_nm)
-
-        heading = float(ac['heading'])
-        altitude = float(ac['altitude'])
-        airspeed = float(ac['airspeed'])
-        loc = 1.0 if ac.get('loc') else 0.0
-        gs = 1.0 if ac.get('gs') else 0.0
-        dtheta = ((heading - self.geom.course_deg + 540.0) % 360.0) - 180.0
-
-        x = np.zeros(N_FEATURES, dtype=np.float32)
-        x[0] = a_nm; x[1] = c_nm; x[2] = d_thr
-        x[3] = dtheta / 180.0
-        x[4] = altitude / 1000.0
-        x[5] = (airspeed - 200.0) / 100.0
-        x[6] = math.sin(math.radians(heading))
-        x[7] = math.cos(math.radians(heading))
-        x[8] = loc; x[9] = gs
-
-        x[:N_CONT] = (x[:N_CONT] - self._mean) / self._std
-        return x
+        thr_x_nm = self.geom.thr_x_nm
+        thr_y_nm = self.geom.thr_y_nm
+        course_deg = self.geom.course_deg
+
+        X = np.zeros((len(acs), N_FEATURES), dtype=np.float32)
+        for x, ac in zip(X, acs):
+            x_nm = (ac['x'] - airport_x) * nm_per_pixel
+            y_nm = -(ac['y'] - airport_y) * nm_per_pixel
+            dx = x_nm - thr_x_nm
+            dy = y_nm - thr_y_nm
+            a_nm = dx * sin_phi + dy * cos_phi
+            c_nm = -dx * cos_phi + dy * sin_phi
+            d_thr = math.sqrt(a_nm * a_nm + c_nm * c_nm)
+
+            heading = float(ac['heading'])
+            altitude = float(ac['altitude'])
+            airspeed = float(ac['airspeed'])
+            loc = 1.0 if ac.get('loc') else 0.0
+            gs = 1.0 if ac.get('gs') else 0.0
+            dtheta = ((heading - course_deg + 540.0) % 360.0) - 180.0
+
+            x[0] = a_nm; x[1] = c_nm; x[2] = d_thr
+            x[3] = dtheta / 180.0
+            x[4] = altitude / 1000.0
+            x[5] = (airspeed - 200.0) / 100.0
+            x[6] = math.sin(math.radians(heading))
+            x[7] = math.cos(math.radians(heading))
+            x[8] = loc; x[9] = gs
+
+        X[:, :N_CONT] = (X[:, :N_CONT] - self._mean) / self._std
+        return X
 
     def predict(self, x: np.ndarray,
                 generator: torch.Generator | None = None) -> dict:
@@ -223,20 +253,19 @@ class Runtime:
         return " ".join(parts) if parts else None
 
     def tick(self, sim, armed: set | None = None) -> list[dict]:
-        env_state = sim.get_state()
-        static = env_state['static']
-        nm_per_pixel = static['nm_per_pixel']
-        airport_x = sim.airport_x
-        airport_y = sim.airport_y
+        # Snapshot only the armed aircraft, and only the fields encode/translate
+        # read (same keys as sim.get_state()), instead of a full get_state()
+        # with every trajectory copied -- this runs once per rollout tick.
+        live = set(sim.aircraft_list)
+        acs = [_policy_view(ac) for cs, ac in sim.aircraft_list.items()
+               if armed is None or cs in armed]
+        X = self.encode_batch(acs, sim.nm_per_pixel, sim.airport_x, sim.airport_y)
 
         report = []
-        for ac in env_state['aircraft']:
+        for ac, x in zip(acs, X):
             cs = ac['callsign']
-            if armed is not None and cs not in armed:
-                continue
             st = self.state_for(cs)
 
-            x = self.encode_state(ac, nm_per_pixel, airport_x, airport_y)
             if st.fm_seed is None:
                 st.fm_seed = _stable_seed(cs)
             gen = torch.Generator(device=self.device)
@@ -251,19 +280,18 @@ class Runtime:
 
             ac_obj = sim.aircraft_list.get(cs)
             if (ac_obj is not None
-                    and not getattr(ac_obj, 'gs_intercepted', False)
-                    and not getattr(ac_obj, 'on_ground', False)
-                    and not getattr(ac_obj, 'landed', False)):
+                    and not ac_obj.gs_intercepted
+                    and not ac_obj.on_ground
+                    and not ac_obj.landed):
                 pred_ft = float(actions['target_alt_kft']) * 1000.0
                 pred_ft = max(self.alt_floor_ft, min(18000.0, pred_ft))
-                if abs(pred_ft - float(getattr(ac_obj, 'target_altitude', pred_ft))) > 25.0:
+                if abs(pred_ft - float(ac_obj.target_altitude)) > 25.0:
                     ac_obj.target_altitude = pred_ft
                     ac_obj.star_apply_alt = False
 
             report.append({'callsign': cs, 'actions': actions,
                            'cmd': cmd, 'sim_result': sim_result})
 
-        live = {ac['callsign'] for ac in env_state['aircraft']}
         for dead in [c for c in self._states if c not in live]:
             del self._states[dead]
         return report
@@ -32,7 +32,8 @@ _LOCK = threading.Lock()
 
 def available():
     """True if a trained checkpoint is on disk (else the service stays transcript-only)."""
-    return os.path.isdir(CKPT) and os.path.exists(os.path.join(CKPT, "config.json"))
+    # One stat: config.json can only be a file if CKPT is a directory.
+    return os.path.isfile(os.path.join(CKPT, "config.json"))
 
 
 def _load():
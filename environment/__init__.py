@@ -7,7 +7,7 @@ Top-level entry points for using the simulation as an RL environment:
     sim = SimulationEnv(airport_name='test', star_mode=True, spawn_single=True)
     state = sim.get_state()
     sim.command(callsign, 'C 270')
-    sim.step(1.0)
+    state = sim.step(1.0)        # snapshot after the tick, as get_state()
 
 See doc/ for architecture, behavior, and logger references.
 """
@@ -1,3 +1,4 @@
+import functools
 import math
 import re
 from environment.params import *
@@ -57,6 +58,11 @@ class Aircraft:
         self.star_apply_spd = True
 
         self.nm_per_pixel = nm_per_pixel
+        # Ground speed (kt) * seconds -> pixels, folded into one reciprocal so
+        # update_position multiplies instead of dividing twice per tick.
+        self.kt_to_px_per_s = 1.0 / (3600.0 * nm_per_pixel)
+        # Look-ahead point for localizer capture, fixed per scope scale.
+        self.loc_projection_px = LOC_PROJECTION_NM / nm_per_pixel
         self.coords = coords
 
     def get_info(self):
@@ -96,9 +102,10 @@ class Aircraft:
                 if not self.ils_runway:
                     return
                 threshold_x, threshold_y = self.coords[self.ils_runway]['x'], self.coords[self.ils_runway]['y']
-                runway_number = ''.join(filter(str.isdigit, self.ils_runway))
-                runway_heading = int(runway_number) * 10
-                if distance_between_coords_pixels(self.x, self.y, threshold_x, threshold_y) < 5:
+                runway_heading = _runway_heading(self.ils_runway)
+                dx = threshold_x - self.x
+                dy = threshold_y - self.y
+                if dx * dx + dy * dy < 25:   # within 5 px of the threshold
                     self.on_ground = self.ils_runway
                     self.target_airspeed = 0
                     self.target_altitude = 0
@@ -277,8 +284,7 @@ class Aircraft:
         if self.airspeed >= 240 or self.altitude >= 5000:
             return False
         threshold_x, threshold_y = self.coords[self.ils_runway]['x'], self.coords[self.ils_runway]['y']
-        runway_number = ''.join(filter(str.isdigit, self.ils_runway))
-        runway_heading = int(runway_number) * 10
+        runway_heading = _runway_heading(self.ils_runway)
         distance_between_coords = distance_between_coords_pixels(self.x, self.y, threshold_x, threshold_y)
         dist_nm = self.nm_per_pixel * distance_between_coords
         angle_diff = heading_diff(self.heading, runway_heading)
@@ -295,13 +301,11 @@ class Aircraft:
         return True
     
     def _update_ils_loc(self):
-        runway_number = ''.join(filter(str.isdigit, self.ils_runway))
-        runway_heading = int(runway_number) * 10
+        runway_heading = _runway_heading(self.ils_runway)
         
         threshold_x, threshold_y = self.coords[self.ils_runway]['x'], self.coords[self.ils_runway]['y']
         
-        projection_distance_nm = 0.3
-        projection_distance_pixels = projection_distance_nm / self.nm_per_pixel
+        projection_distance_pixels = self.loc_projection_px
         
         heading_rad = math.radians(self.heading)
         projected_x = self.x + projection_distance_pixels * math.sin(heading_rad)
@@ -318,7 +322,7 @@ class Aircraft:
             rwy_extension_hdg = (runway_heading + 180) % 360
 
             aircraft_to_extension_proj = self.nm_per_pixel * projection_distance(self.x, self.y, rwy_extension_hdg, threshold_x, threshold_y)
-            angle_diff = abs(math.degrees(math.asin(aircraft_to_extension_proj / projection_distance_nm)))
+            angle_diff = abs(math.degrees(math.asin(aircraft_to_extension_proj / LOC_PROJECTION_NM)))
             candidate_heading_1 = (runway_heading - angle_diff) % 360
             candidate_heading_2 = (runway_heading + angle_diff) % 360
 
@@ -343,9 +347,7 @@ class Aircraft:
             self.target_altitude = projected_alt
 
     def update_position(self, delta_t):
-        nm_per_second = ias_to_gs(self.airspeed, self.altitude) / 3600
-        nm_traveled = nm_per_second * delta_t
-        pixels_traveled = nm_traveled / self.nm_per_pixel
+        pixels_traveled = ias_to_gs(self.airspeed, self.altitude) * delta_t * self.kt_to_px_per_s
 
         heading_rad = math.radians(self.heading)
         dx = pixels_traveled * math.sin(heading_rad)
@@ -356,7 +358,7 @@ class Aircraft:
 
         self.trajectory.append((self.x, self.y))
         if len(self.trajectory) > TRAJ_LENGTH:
-            self.trajectory = self.trajectory[-TRAJ_LENGTH:]
+            del self.trajectory[:-TRAJ_LENGTH]
 
     def process_command(self, cmd):
         try:
@@ -365,38 +367,9 @@ class Aircraft:
             return {'ok': False, 'category': 'invalid', 'message': f'internal error: {e}'}
 
     def _process_command_inner(self, cmd):
-        cmd = cmd.strip()
-        if not cmd:
-            return {'ok': False, 'category': 'invalid', 'message': 'empty command'}
-
-        commands = cmd.split()
-        if commands[0].upper() == "A":
-            commands.insert(1, None)
-        if len(commands) % 2 != 0:
-            return {'ok': False, 'category': 'invalid', 'message': 'expected pairs of TYPE PARAM'}
-
-        command_pairs = []
-        for i in range(0, len(commands), 2):
-            command_pairs.append((commands[i], commands[i + 1]))
-
-        command_types = [pair[0] for pair in command_pairs]
-
-        for ct in command_types:
-            if ct not in ('A', 'C', 'S', 'H', 'L'):
-                return {'ok': False, 'category': 'invalid', 'message': f'unknown command type: {ct}'}
-
-        if 'H' in command_types and ('C' in command_types or 'L' in command_types):
-            return {'ok': False, 'category': 'invalid', 'message': 'H cannot be combined with C or L'}
-
-        a_index = command_types.index('A') if 'A' in command_types else -1
-        l_index = command_types.index('L') if 'L' in command_types else len(command_types)
-
-        for i, cmd_type in enumerate(command_types):
-            if cmd_type in ['C', 'S', 'H']:
-                if a_index != -1 and i < a_index:
-                    return {'ok': False, 'category': 'invalid', 'message': 'A must come first in chain'}
-                if i >= l_index:
-                    return {'ok': False, 'category': 'invalid', 'message': 'L must come last in chain'}
+        err, command_pairs = _parse_command(cmd)
+        if err:
+            return {'ok': False, 'category': 'invalid', 'message': err}
 
         for cmd_type, param in command_pairs:
             err = self._validate_param(cmd_type, param)
@@ -668,4 +641,52 @@ class Aircraft:
             self.gs_intercepted = False
             return None
 
-        return f"unknown command type: {cmd_type}"
\ No newline at end of file
+        return f"unknown command type: {cmd_type}"
+
+
+# Runway ids are few and fixed per airport ('27', '09L', ...), while the ILS
+# checks need the heading every tick: parse the digits once per id.
+@functools.lru_cache(maxsize=64)
+def _runway_heading(runway):
+    return int(''.join(filter(str.isdigit, runway))) * 10
+
+
+# The grammar checks depend only on the typed string, and the AUTO planner
+# re-issues the same few heading/speed strings every tick, so parse results are
+# memoized. Returns (error_message, None) or (None, ((TYPE, PARAM), ...)).
+@functools.lru_cache(maxsize=512)
+def _parse_command(cmd):
+    cmd = cmd.strip()
+    if not cmd:
+        return 'empty command', None
+
+    commands = cmd.split()
+    if commands[0].upper() == "A":
+        commands.insert(1, None)
+    if len(commands) % 2 != 0:
+        return 'expected pairs of TYPE PARAM', None
+
+    command_pairs = []
+    for i in range(0, len(commands), 2):
+        command_pairs.append((commands[i], commands[i + 1]))
+
+    command_types = [pair[0] for pair in command_pairs]
+
+    for ct in command_types:
+        if ct not in ('A', 'C', 'S', 'H', 'L'):
+            return f'unknown command type: {ct}', None
+
+    if 'H' in command_types and ('C' in command_types or 'L' in command_types):
+        return 'H cannot be combined with C or L', None
+
+    a_index = command_types.index('A') if 'A' in command_types else -1
+    l_index = command_types.index('L') if 'L' in command_types else len(command_types)
+
+    for i, cmd_type in enumerate(command_types):
+        if cmd_type in ['C', 'S', 'H']:
+            if a_index != -1 and i < a_index:
+                return 'A must come first in chain', None
+            if i >= l_index:
+                return 'L must come last in chain', None
+
+    return None, tuple(command_pairs)
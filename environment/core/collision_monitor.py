@@ -1,5 +1,9 @@
 import math
-from environment.utils import *
+
+_FORWARD_NEIGHBOURS = ((0, 1), (1, -1), (1, 0), (1, 1))
+# Neighbour order of the full 3x3 sweep (self excluded), which fixes the order
+# crash partners are named in.
+_SWEEP_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
 
 class CollisionMonitor:
     def __init__(self, screen_width, screen_height, nm_per_pixel,
@@ -14,17 +18,28 @@ class CollisionMonitor:
         self.strict_lateral_nm = 2.0
 
         self.min_separation_pixel = 3 / self.nm_per_pixel
+        self.crash_threshold_pixels = 0.2 / self.nm_per_pixel
+        # Squared radii for the pair checks, which only compare against them.
+        self.min_separation_sq = self.min_separation_pixel * self.min_separation_pixel
+        self.crash_threshold_sq = self.crash_threshold_pixels * self.crash_threshold_pixels
+        strict_lateral_pixel = self.strict_lateral_nm / self.nm_per_pixel
+        self.strict_lateral_sq = strict_lateral_pixel * strict_lateral_pixel
+        # True when the last check_collisions flagged any pair, so "is anyone
+        # in conflict" needs no rescan of the per-aircraft flags.
+        self.any_warning = False
+        # Colliding pairs found by the last sweep, named by _name_crash_partners.
+        self._crash_pairs = []
         self.grid_width = self.min_separation_pixel / math.sqrt(2)
 
         self.grid_cols = math.ceil(self.screen_width / self.grid_width)
         self.grid_rows = math.ceil(self.screen_height / self.grid_width)
         
-        self.grids = [[[] for _ in range(self.grid_cols)] for _ in range(self.grid_rows)]
+        # Sparse grid: (row, col) -> aircraft, holding only occupied cells, so a
+        # tick costs O(aircraft) instead of clearing/scanning every cell.
+        self.grids = {}
 
     def clear_grids(self):
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                self.grids[row][col].clear()
+        self.grids.clear()
 
     def place_aircraft_in_grid(self, aircraft):
         x, y = aircraft.x, aircraft.y
@@ -32,58 +47,86 @@ class CollisionMonitor:
         grid_col = max(0, min(int(x // self.grid_width), self.grid_cols - 1))
         grid_row = max(0, min(int(y // self.grid_width), self.grid_rows - 1))
         
-        self.grids[grid_row][grid_col].append(aircraft)
-
-    def get_neighboring_grids(self, grid_row, grid_col):
-        neighbors = []
-        
-        for row_offset in [-1, 0, 1]:
-            for col_offset in [-1, 0, 1]:
-                neighbor_row = grid_row + row_offset
-                neighbor_col = grid_col + col_offset
-                
-                if (0 <= neighbor_row < self.grid_rows and 
-                    0 <= neighbor_col < self.grid_cols):
-                    neighbors.append((neighbor_row, neighbor_col))
-        
-        return neighbors
+        cell = self.grids.get((grid_row, grid_col))
+        if cell is None:
+            self.grids[(grid_row, grid_col)] = [aircraft]
+        else:
+            cell.append(aircraft)
 
     def check_collisions(self, aircraft_list):
         for aircraft in aircraft_list:
             aircraft.collision_warning = False
+        self.any_warning = False
         
         self.clear_grids()
         for aircraft in aircraft_list:
             self.place_aircraft_in_grid(aircraft)
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                current_grid_aircraft = self.grids[row][col]
-                
-                self._check_aircraft_pairs_in_grid(current_grid_aircraft)
-                neighbors = self.get_neighboring_grids(row, col)
-                for neighbor_row, neighbor_col in neighbors:
-                    if neighbor_row == row and neighbor_col == col:
-                        continue
-                    
-                    neighbor_aircraft = self.grids[neighbor_row][neighbor_col]
+        grids = self.grids
+        # Occupied cells only, in insertion order. Each cell is paired with the
+        # forward half of its 3x3 neighbourhood (E, SW, S, SE), so every
+        # adjacent pair of cells is checked once rather than from both sides.
+        # Warning flags don't depend on visit order; crash partners are named
+        # in full-sweep order afterwards by _name_crash_partners.
+        for (row, col), current_grid_aircraft in grids.items():
+            self._check_aircraft_pairs_in_grid(current_grid_aircraft)
+            for row_offset, col_offset in _FORWARD_NEIGHBOURS:
+                neighbor_aircraft = grids.get((row + row_offset, col + col_offset))
+                if neighbor_aircraft:
                     self._check_aircraft_pairs_between_grids(current_grid_aircraft, neighbor_aircraft)
+        if self._crash_pairs:
+            self._name_crash_partners()
+
+    def _name_crash_partners(self):
+        # An aircraft in several collisions is reported against the partner
+        # from the last colliding pair of the full 3x3 sweep: every cell
+        # row-major, its own pairs first, then each of the eight neighbours in
+        # _SWEEP_OFFSETS order (each cross-cell pair last seen from the later
+        # cell). The forward-half sweep finds the same pairs in another order,
+        # so replay them in sweep order before writing the crash reasons.
+        slots = {}
+        for cell, cell_aircraft in self.grids.items():
+            for i, aircraft in enumerate(cell_aircraft):
+                slots[id(aircraft)] = (cell, i)
+
+        def sweep_key(pair):
+            cell1, i1 = slots[id(pair[0])]
+            cell2, i2 = slots[id(pair[1])]
+            if cell1 == cell2:
+                return (cell1, -1, min(i1, i2), max(i1, i2))
+            if cell1 < cell2:
+                cell1, i1, cell2, i2 = cell2, i2, cell1, i1
+            offset = (cell2[0] - cell1[0], cell2[1] - cell1[1])
+            return (cell1, _SWEEP_OFFSETS.index(offset), i1, i2)
+
+        for aircraft1, aircraft2 in sorted(self._crash_pairs, key=sweep_key):
+            aircraft1.crash = f"collided with {aircraft2.callsign}"
+            aircraft2.crash = f"collided with {aircraft1.callsign}"
+        self._crash_pairs.clear()
 
     def _check_aircraft_pairs_in_grid(self, aircraft_list):
-        for i in range(len(aircraft_list)):
-            for j in range(i + 1, len(aircraft_list)):
-                aircraft1 = aircraft_list[i]
-                aircraft2 = aircraft_list[j]
-                self._check_aircraft_pair(aircraft1, aircraft2)
+        check_pair = self._check_aircraft_pair
+        n = len(aircraft_list)
+        for i in range(n):
+            aircraft1 = aircraft_list[i]
+            for j in range(i + 1, n):
+                check_pair(aircraft1, aircraft_list[j])
 
     def _check_aircraft_pairs_between_grids(self, grid1_aircraft, grid2_aircraft):
+        # Hot loop: bind attribute/method lookups to locals once per cell pair.
+        min_sep_sq = self.min_separation_sq
+        check_pair = self._check_aircraft_pair
         for aircraft1 in grid1_aircraft:
+            x1, y1 = aircraft1.x, aircraft1.y
             for aircraft2 in grid2_aircraft:
-                distance = distance_between_coords_pixels(aircraft1.x, aircraft1.y, aircraft2.x, aircraft2.y)
-                if distance < self.min_separation_pixel:
-                    self._check_aircraft_pair(aircraft1, aircraft2)
+                dx = aircraft2.x - x1
+                dy = aircraft2.y - y1
+                if dx * dx + dy * dy < min_sep_sq:
+                    check_pair(aircraft1, aircraft2)
 
     def _check_aircraft_pair(self, aircraft1, aircraft2):
         vertical_separation = abs(aircraft1.altitude - aircraft2.altitude)
+        dx = aircraft2.x - aircraft1.x
+        dy = aircraft2.y - aircraft1.y
 
         collision_warning = False
 
@@ -93,9 +136,7 @@ class CollisionMonitor:
             # status is ignored.
             same_medium = bool(aircraft1.on_ground) == bool(aircraft2.on_ground)
             if same_medium and vertical_separation < 1000:
-                lateral_nm = self.nm_per_pixel * distance_between_coords_pixels(
-                    aircraft1.x, aircraft1.y, aircraft2.x, aircraft2.y)
-                if lateral_nm < self.strict_lateral_nm:
+                if dx * dx + dy * dy < self.strict_lateral_sq:
                     collision_warning = True
         else:
             if vertical_separation < 1000 and not aircraft1.ils_runway and not aircraft2.ils_runway and not aircraft1.on_ground and not aircraft2.on_ground:
@@ -107,11 +148,8 @@ class CollisionMonitor:
         if collision_warning:
             aircraft1.collision_warning = True
             aircraft2.collision_warning = True
+            self.any_warning = True
         
         if vertical_separation <= 50:
-            pixel_distance = distance_between_coords_pixels(aircraft1.x, aircraft1.y, aircraft2.x, aircraft2.y)
-            crash_threshold_pixels = 0.2 / self.nm_per_pixel
-            
-            if pixel_distance <= crash_threshold_pixels:
-                aircraft1.crash = f"collided with {aircraft2.callsign}"
-                aircraft2.crash = f"collided with {aircraft1.callsign}"
\ No newline at end of file
+            if dx * dx + dy * dy <= self.crash_threshold_sq:
+                self._crash_pairs.append((aircraft1, aircraft2))
\ No newline at end of file
@@ -3,6 +3,24 @@ from environment.core.aircraft_spawner import AircraftSpawner
 from environment.core.collision_monitor import CollisionMonitor
 
 
+# Flattened name -> {x, y} index per layout. generate_game_coordinates returns
+# the same memoized layout object for an airport, so restarts and AUTO rollout
+# sub-sims reuse one index instead of re-walking runways/navaids each time.
+# Shared and read-only, like the layout itself.
+_LAYOUT_COORDS = {}
+
+
+def _layout_coords(data):
+    hit = _LAYOUT_COORDS.get(id(data))
+    if hit is not None and hit[0] is data:
+        return hit[1]
+    coords = SimulationEnv._flatten_coords(data)
+    if len(_LAYOUT_COORDS) >= 16:
+        _LAYOUT_COORDS.clear()
+    _LAYOUT_COORDS[id(data)] = (data, coords)
+    return coords
+
+
 class SimulationEnv:
     def __init__(self, radar_side=800, nm_range=60, airport_name="test", spawn_rate=90,
                  spawn_directions=None, spawn_single=False, star_mode=False, recorder=None):
@@ -16,7 +34,7 @@ class SimulationEnv:
         self.nm_per_pixel = self.data['screen_info']['nm_per_pixel']
         self.airport_x = self.data['airport']['coordinates']['x']
         self.airport_y = self.data['airport']['coordinates']['y']
-        self.coords = self._flatten_coords(self.data)
+        self.coords = _layout_coords(self.data)
 
         self.spawn_rate = spawn_rate
         self.spawn_directions = list(spawn_directions) if spawn_directions else ["N", "S", "E", "W"]
@@ -48,14 +66,9 @@ class SimulationEnv:
     def _flatten_coords(data):
         coords = {'airport': data['airport']['coordinates']}
         for rwy_data in data['runways'].values():
-            for thr, thr_data in rwy_data['thresholds'].items():
-                coords[thr] = thr_data
-        for vor, vor_data in data['vor_stations'].items():
-            coords[vor] = vor_data['coordinates']
-        for ndb, ndb_data in data['ndb_stations'].items():
-            coords[ndb] = ndb_data['coordinates']
-        for wpt, wpt_data in data['rnav_waypoints'].items():
-            coords[wpt] = wpt_data['coordinates']
+            coords.update(rwy_data['thresholds'])
+        for section in ('vor_stations', 'ndb_stations', 'rnav_waypoints'):
+            coords.update((name, item['coordinates']) for name, item in data[section].items())
         return coords
 
     def _add_spawned_aircraft(self, new_aircraft):
@@ -68,10 +81,19 @@ class SimulationEnv:
                     self.aircraft_list[retry.callsign] = retry
                     break
 
-    def step(self, delta_t=1.0):
+    def step(self, delta_t=1.0, return_state=True):
+        """Advance the simulation by one tick and return get_state().
+
+        Internal loops that run several ticks per snapshot (the /step
+        fast_forward loop and the Pyodide bootstrap, the AUTO planner and its
+        rollout sub-sims, --bench) pass return_state=False and get None; they
+        take one get_state() per batch themselves.
+        """
         if self.crash_occurred:
-            return self.get_state()
+            return self.get_state() if return_state else None
 
+        # One snapshot of the callsign index per tick, shared by the collision
+        # check and the update loop (removals are deferred until after both).
         aircraft_list = list(self.aircraft_list.values())
         self.collision_monitor.check_collisions(aircraft_list)
 
@@ -81,20 +103,18 @@ class SimulationEnv:
                 self.crash_message = f"CRASH: {aircraft.callsign} {aircraft.crash}"
                 break
 
-        self.has_violation = False
+        self.has_violation = self.collision_monitor.any_warning
         to_remove = []
         removal_reason = {}
+        side = self.radar_side
 
-        for aircraft in list(self.aircraft_list.values()):
+        for aircraft in aircraft_list:
             if not self.crash_occurred:
                 aircraft.update(delta_t)
 
-            if aircraft.collision_warning:
-                self.has_violation = True
-
             x, y = aircraft.x, aircraft.y
             cs = aircraft.callsign
-            if x < 0 or x > self.radar_side or y < 0 or y > self.radar_side:
+            if not (0 <= x <= side and 0 <= y <= side):
                 to_remove.append(cs)
                 removal_reason[cs] = 'IMPROPER_EXIT'
                 self.improper_exits += 1
@@ -128,15 +148,16 @@ class SimulationEnv:
         if self.has_violation:
             self.violation_seconds += delta_t
 
-        return self.get_state()
+        return self.get_state() if return_state else None
 
     def command(self, callsign, cmd_string):
         callsign = callsign.upper()
-        if callsign not in self.aircraft_list:
+        aircraft = self.aircraft_list.get(callsign)
+        if aircraft is None:
             return {"ok": False, "category": "invalid",
                     "message": f"unknown callsign: {callsign}",
                     "callsign_valid": False}
-        result = self.aircraft_list[callsign].process_command(cmd_string.upper())
+        result = aircraft.process_command(cmd_string.upper())
         result["callsign_valid"] = True
         result["callsign"] = callsign
         if self.recorder:
@@ -209,7 +230,10 @@ class SimulationEnv:
     def is_recording(self):
         return self.recorder is not None
 
-    def get_state(self):
+    def get_state(self, include_static=True):
+        """Snapshot for the UI / RL callers. The "static" block (airport layout,
+        navaids, STARs) never changes within a run, so per-tick callers pass
+        include_static=False and keep the copy from the last full snapshot."""
         aircraft_state = []
         for ac in self.aircraft_list.values():
             aircraft_state.append({
@@ -234,17 +258,7 @@ class SimulationEnv:
                 "star": ac.star_name if ac.star else None,
             })
 
-        return {
-            "static": {
-                "airport": self.data['airport'],
-                "runways": self.data['runways'],
-                "vor_stations": self.data['vor_stations'],
-                "ndb_stations": self.data['ndb_stations'],
-                "rnav_waypoints": self.data['rnav_waypoints'],
-                "star_procedures": self.data.get('star_procedures', {}),
-                "nm_per_pixel": self.nm_per_pixel,
-                "radar_side": self.radar_side,
-            },
+        state = {
             "aircraft": aircraft_state,
             "scoring": {
                 "num_landed": self.num_landed,
@@ -268,3 +282,15 @@ class SimulationEnv:
             "recording": self.is_recording(),
             "airport_name": self.airport_name,
         }
+        if include_static:
+            state["static"] = {
+                "airport": self.data['airport'],
+                "runways": self.data['runways'],
+                "vor_stations": self.data['vor_stations'],
+                "ndb_stations": self.data['ndb_stations'],
+                "rnav_waypoints": self.data['rnav_waypoints'],
+                "star_procedures": self.data.get('star_procedures', {}),
+                "nm_per_pixel": self.nm_per_pixel,
+                "radar_side": self.radar_side,
+            }
+        return state
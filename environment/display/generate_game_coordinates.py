@@ -1,37 +1,63 @@
+import functools
 import math
 import json
 import os
 
-def nm_distance(lat1, lon1, lat2, lon2):
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    return 3440.065 * c
+# orjson is optional (absent in the Pyodide build); stdlib json is the fallback.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Every SimulationEnv (incl. each AUTO rollout sub-sim) calls
+# generate_game_coordinates, so parsing and projection are memoized on the data
+# files' mtimes. Cached documents are shared between sims: treat as read-only.
+@functools.lru_cache(maxsize=32)
+def _load_json(path, mtime):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return _orjson.loads(raw) if _orjson is not None else json.loads(raw)
+
+@functools.lru_cache(maxsize=32)
+def _data_paths(name):
+    return (os.path.join(_DATA_DIR, f'{name}.json'),
+            os.path.join(_DATA_DIR, f'{name}_navigation.json'))
 
 def latlon_to_xy(latlons, ref=None):
     if ref is None:
         ref = latlons[0]
     lat0, lon0 = math.radians(ref[0]), math.radians(ref[1])
+    # Reference-point terms are the same for every point: evaluate them once.
+    # The per-point expressions keep their original operation order, so the
+    # results are bit-identical to computing them inline.
+    cos_lat0 = math.cos(lat0)
+    deg_per_rad = 180/math.pi
+    radians = math.radians
     coords = []
     for lat, lon in latlons:
-        dlat = math.radians(lat) - lat0
-        dlon = math.radians(lon) - lon0
-        x = dlon * math.cos(lat0) * 60 * (180/math.pi)
-        y = dlat * 60 * (180/math.pi)
+        dlat = radians(lat) - lat0
+        dlon = radians(lon) - lon0
+        x = dlon * cos_lat0 * 60 * deg_per_rad
+        y = dlat * 60 * deg_per_rad
         coords.append((x, y))
     return coords
 
 def generate_game_coordinates(screen_width=800, screen_height=800, nm_range=60, airport_name="egll"):
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(os.path.dirname(script_dir), 'data')
     name = airport_name.lower()
-    with open(os.path.join(data_dir, f'{name}.json'), 'r') as f:
-        airport_data = json.load(f)
-    with open(os.path.join(data_dir, f'{name}_navigation.json'), 'r') as f:
-        navigation_data = json.load(f)
+    airport_path, navigation_path = _data_paths(name)
+    mtimes = (os.path.getmtime(airport_path), os.path.getmtime(navigation_path))
+    return _cached_layout(screen_width, screen_height, nm_range, name, mtimes)
+
+@functools.lru_cache(maxsize=16)
+def _cached_layout(screen_width, screen_height, nm_range, name, mtimes):
+    airport_path, navigation_path = _data_paths(name)
+    return _project_layout(_load_json(airport_path, mtimes[0]),
+                           _load_json(navigation_path, mtimes[1]),
+                           screen_width, screen_height, nm_range)
 
+def _project_layout(airport_data, navigation_data, screen_width, screen_height, nm_range):
     nm_per_pixel = nm_range / screen_width
 
     all_coords = {}
@@ -96,9 +122,11 @@ def generate_game_coordinates(screen_width=800, screen_height=800, nm_range=60,
         all_latlon_pairs.append(ndb_data['coordinates'])
 
     nm_coords = latlon_to_xy(all_latlon_pairs, airport_ref)
+    half_w = screen_width / 2
+    half_h = screen_height / 2
     game_coords = [
-        (nm_x / nm_per_pixel + screen_width / 2,
-         -nm_y / nm_per_pixel + screen_height / 2)
+        (nm_x / nm_per_pixel + half_w,
+         -nm_y / nm_per_pixel + half_h)
         for nm_x, nm_y in nm_coords
     ]
     output_data = {
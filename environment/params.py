@@ -9,6 +9,7 @@ EXP_SPEED_CHANGE_RATE = 4
 TRAJ_LENGTH = 10
 SHORT_FINAL_IAS = 140
 GROUND_DECELERATION_RATE = 3
+LOC_PROJECTION_NM = 0.3
 
 #airline names
 
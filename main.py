@@ -1,6 +1,24 @@
 import argparse
+import random
+import time
 
-from app import app, init_simulation, NoNagleRequestHandler
+
+def run_benchmark(steps, airport, star_mode, seed=0):
+    """Advance one headless sim for `steps` ticks and report throughput. No
+    server, no rendering, no state snapshots -- just SimulationEnv.step()."""
+    from environment import SimulationEnv
+    random.seed(seed)
+    sim = SimulationEnv(airport_name=airport, star_mode=star_mode)
+    done = 0
+    t0 = time.perf_counter()
+    while done < steps and not sim.crash_occurred:   # a crash freezes the sim
+        sim.step(1.0, return_state=False)
+        done += 1
+    elapsed = time.perf_counter() - t0
+    print(f"[bench] {airport} {'star' if star_mode else 'free'}: {done} steps in "
+          f"{elapsed:.3f}s ({done / max(elapsed, 1e-9):.0f} steps/s), "
+          f"aircraft={len(sim.aircraft_list)} landed={sim.num_landed} "
+          f"exits={sim.improper_exits} crash={sim.crash_occurred}")
 
 
 def main():
@@ -23,7 +41,19 @@ def main():
     parser.add_argument('--dev', action='store_true',
                         help='force the Werkzeug dev server instead of waitress')
 
+    parser.add_argument('--bench', type=int, metavar='STEPS',
+                        help='run the simulator headless for STEPS ticks, print '
+                             'throughput, and exit (no server)')
+
     args = parser.parse_args()
+    if args.bench is not None:
+        if args.bench < 1:
+            parser.error('--bench STEPS must be at least 1')
+        run_benchmark(args.bench, args.airport, star_mode=not args.free_mode)
+        return
+
+    # Imported here so --bench doesn't pull in Flask or kick off app's warmups.
+    from app import app, init_simulation, NoNagleRequestHandler
     init_simulation(airport=args.airport, star_mode=not args.free_mode)
 
     # Serve via waitress (a real WSGI server) for both local and the HF deploy --
@@ -33,7 +63,11 @@ def main():
         try:
             from waitress import serve
             print(f"[serve] waitress on {args.host}:{args.port} (threads={args.threads})")
-            serve(app, host=args.host, port=args.port, threads=args.threads)
+            # poll() instead of select() for waitress's I/O loop: select() caps
+            # descriptor numbers at FD_SETSIZE (1024), which a busy multi-session
+            # deploy (keep-alive sockets + worker pipes) can run into.
+            serve(app, host=args.host, port=args.port, threads=args.threads,
+                  asyncore_use_poll=True)
             return
         except ImportError:
             print("[serve] waitress not installed; falling back to dev server")